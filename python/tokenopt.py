@@ -5,12 +5,118 @@ Production SDK for the YAVIQ Token Optimization Platform.
 Handles authentication, request/response serialization, and error handling.
 """
 
+import asyncio
+import copy
+import gzip
+import hashlib
 import json
+import logging
 import os
-from typing import Dict, List, Optional, Any, Union
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib import request, error
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - optional dependency
+    urllib3 = None
+
+logger = logging.getLogger("yaviq")
+logger.addHandler(logging.NullHandler())
+
 DEFAULT_ENDPOINT = "https://api.yaviq.local"
+DEFAULT_CACHE_SIZE = 512
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_INPUT_BYTES = 8 * 1024 * 1024
+
+# Public compression mode aliases mapped to backend mode names.
+_MODE_MAP = MappingProxyType({
+    "low": "safe",
+    "safe": "safe",
+    "medium": "balanced",
+    "balanced": "balanced",
+    "high": "aggressive",
+    "aggressive": "aggressive",
+})
+
+# Request bodies larger than this are gzip-compressed before sending.
+COMPRESS_MIN_BYTES = 1024
+
+# Endpoints whose responses depend only on the request body and may be
+# served from the client-side response cache.
+_CACHEABLE_PATHS = frozenset({
+    "/v1/optimize",
+    "/v1/convert-to-toon",
+    "/v1/convert-from-toon",
+    "/v1/estimate",
+})
+
+# Endpoints that can return multi-megabyte bodies; their responses are parsed
+# incrementally off the socket instead of being buffered in full.
+_STREAMING_PATHS = frozenset({
+    "/v1/optimize-run",
+    "/v1/optimize-run-batch",
+})
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    
+    # json.loads accepts UTF-8 bytes directly.
+    _json_loads = json.loads
+
+
+def _decode_response(content_type: Optional[str], response_body: bytes) -> Any:
+    """Decode a response body as msgpack or JSON according to its Content-Type."""
+    if content_type and msgpack is not None and "msgpack" in content_type.lower():
+        return msgpack.unpackb(response_body, raw=False)
+    return _json_loads(response_body)
+
+
+def _check_input_size(size: int, limit: int) -> None:
+    """Reject inputs over the client-side size limit before any serialization."""
+    if limit and size > limit:
+        raise ValidationError(f"Input too large ({size} characters); the client limit is {limit}")
+
+
+def _clean(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop None-valued fields so they are not sent as JSON nulls."""
+    return {k: v for k, v in body.items() if v is not None}
 
 
 class YAVIQError(Exception):
@@ -30,8 +136,8 @@ class NetworkError(YAVIQError):
 
 class ValidationError(YAVIQError):
     """Request validation failures (400-level errors)."""
-    def __init__(self, message: str):
-        super().__init__(message, 400, "VALIDATION_ERROR")
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message, status_code or 400, "VALIDATION_ERROR")
 
 
 class TOONParseError(YAVIQError):
@@ -52,6 +158,34 @@ class SchemaMismatchError(YAVIQError):
         super().__init__(message, 400, "SCHEMA_MISMATCH")
 
 
+def _raise_for_status(status: int, response_body: bytes) -> None:
+    """Translate a non-2xx HTTP response into the matching SDK exception."""
+    error_body = response_body.decode("utf-8", errors="ignore")
+    try:
+        error_data = json.loads(error_body)
+        error_msg = error_data.get("error") or error_data.get("message") or error_body
+    except (json.JSONDecodeError, AttributeError):
+        error_msg = error_body or f"HTTP {status}"
+    
+    if 400 <= status < 500:
+        raise ValidationError(f"Request failed ({status}): {error_msg}", status)
+    elif status >= 500:
+        raise EngineFailureError(f"Server error ({status}): {error_msg}", status)
+    else:
+        raise NetworkError(f"Request failed ({status}): {error_msg}", status)
+
+
+def _unwrap_response(result: Any) -> Any:
+    """Unwrap {success: true, data: {...}} envelopes and raise on {success: false}."""
+    if isinstance(result, dict) and result.get("success") is True and "data" in result:
+        return result["data"]
+    if isinstance(result, dict) and result.get("success") is False:
+        error_msg = result.get("error", "Unknown error")
+        status = result.get("status", 500)
+        raise EngineFailureError(error_msg, status)
+    return result
+
+
 class YAVIQClient:
     """
     Main client for interacting with the YAVIQ API.
@@ -60,7 +194,15 @@ class YAVIQClient:
     client instances or implement appropriate locking.
     """
     
-    def __init__(self, api_key: Optional[str] = None, endpoint: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_input_bytes: int = DEFAULT_MAX_INPUT_BYTES,
+        transport: str = "auto",
+        use_msgpack: bool = False,
+    ):
         """
         Initialize YAVIQ client.
         
@@ -68,20 +210,138 @@ class YAVIQClient:
             api_key: API key for authentication. If None, reads from YAVIQ_API_KEY env var.
             endpoint: Base API endpoint URL. If None, reads from YAVIQ_ENDPOINT env var
                      or defaults to DEFAULT_ENDPOINT.
+            cache_size: Maximum number of responses kept in the in-memory LRU cache
+                       for deterministic endpoints. Use 0 to disable caching.
+            max_input_bytes: Largest input accepted before a request is sent, measured
+                            in characters (a lower bound on UTF-8 bytes). Use 0 to
+                            disable the check.
+            transport: "auto" uses urllib3 connection pooling when installed and
+                      urllib otherwise. "http2" multiplexes all calls over a single
+                      httpx HTTP/2 connection (requires httpx[http2]).
+            use_msgpack: Send TOON conversion requests as msgpack instead of JSON
+                        (requires msgpack and a server with msgpack support).
+                        Falls back to JSON if the server answers 415.
         
         Raises:
-            ValidationError: If API key is not provided.
+            ValidationError: If API key is not provided or transport is unknown.
+            ImportError: If transport="http2" and httpx[http2] is not installed,
+                        or use_msgpack=True and msgpack is not installed.
         """
         self.api_key = api_key or os.environ.get("YAVIQ_API_KEY", "")
         self.endpoint = endpoint or os.environ.get("YAVIQ_ENDPOINT", DEFAULT_ENDPOINT)
         self.send_telemetry = False
+        self._batch_supported = True
+        self._estimate_supported = True
+        self._compress_requests = True
+        self._msgpack_supported = use_msgpack
+        self.cache_size = cache_size
+        self.max_input_bytes = max_input_bytes
+        self._cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         if not self.api_key:
             raise ValidationError(
                 "API key is required. Set YAVIQ_API_KEY environment variable or pass api_key to constructor."
             )
+        
+        if transport not in ("auto", "http2"):
+            raise ValidationError(f"Unknown transport {transport!r}; expected 'auto' or 'http2'")
+        if transport == "http2" and httpx is None:
+            raise ImportError("transport='http2' requires httpx. Install it with: pip install yaviq[http2]")
+        if use_msgpack and msgpack is None:
+            raise ImportError("use_msgpack=True requires msgpack. Install it with: pip install yaviq[fast]")
+        
+        # Pooled connections are reused across calls; falls back to urllib
+        # (one connection per request) when urllib3 is not installed.
+        self._http = None
+        self._client = None
+        # urlopen does not decode responses, so the stdlib path only
+        # advertises gzip (decoded in _send_urllib).
+        self._accept_encoding = "gzip"
+        if transport == "http2":
+            # httpx always decodes gzip and deflate.
+            self._accept_encoding = "gzip, deflate"
+        elif urllib3 is not None:
+            # Advertise every codec urllib3 can decode (brotli/zstd when installed).
+            self._accept_encoding = urllib3.util.make_headers(accept_encoding=True)["accept-encoding"]
+            # Default policy: retry connection failures only (safe for any
+            # endpoint, since the request never reached the server).
+            self._http = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=16,
+                retries=urllib3.Retry(total=3, backoff_factor=0.3),
+            )
+            # Deterministic endpoints may also be retried on gateway errors.
+            # /v1/optimize-run is never retried this way: it would re-bill
+            # the LLM call.
+            self._idempotent_retries = urllib3.Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            )
+        
+        # Built once and shared by every request; never mutated after init.
+        self._auth_header = f"Bearer {self.api_key}"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": self._auth_header,
+            "Accept-Encoding": self._accept_encoding,
+        }
+        self._msgpack_headers = {
+            **self._headers,
+            "Content-Type": MSGPACK_CONTENT_TYPE,
+            "Accept": MSGPACK_CONTENT_TYPE,
+        }
+        
+        if transport == "http2":
+            # One TCP+TLS handshake shared by every endpoint; concurrent calls
+            # are multiplexed as HTTP/2 streams.
+            # No timeout, matching the urllib and urllib3 transports:
+            # /v1/optimize-run waits on an LLM call and can run long.
+            self._client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=8),
+                headers=self._headers,
+                timeout=None,
+            )
+    
+    @property
+    def endpoint(self) -> str:
+        """Base API endpoint URL. Reassigning it takes effect on the next request."""
+        return self._endpoint
+    
+    @endpoint.setter
+    def endpoint(self, value: str) -> None:
+        self._endpoint = value
+        self._base = value.rstrip("/")
+    
+    def close(self) -> None:
+        """Release pooled HTTP connections held by this client."""
+        if self._http is not None:
+            self._http.clear()
+        if self._client is not None:
+            self._client.close()
+    
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def __enter__(self) -> "YAVIQClient":
+        return self
     
-    def _http_post(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _http_post(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        cache: bool = False,
+        binary: bool = False,
+    ) -> Dict[str, Any]:
         """
         Execute HTTP POST request to the YAVIQ API.
         
@@ -92,6 +352,11 @@ class YAVIQClient:
         Args:
             path: API endpoint path (e.g., "/v1/optimize")
             body: Request payload dictionary
+            cache: Serve and store the response in the LRU cache. Only honored
+                  for endpoints listed in _CACHEABLE_PATHS.
+            binary: Send and accept msgpack instead of JSON when the client was
+                   created with use_msgpack=True. Falls back to JSON if the
+                   server answers 415.
         
         Returns:
             Parsed response data dictionary
@@ -101,50 +366,194 @@ class YAVIQClient:
             EngineFailureError: For 5xx server errors
             NetworkError: For network-level failures
         """
-        url = self.endpoint.rstrip("/") + path
-        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
-        
-        req = request.Request(
-            url,
-            data=payload,
-            method="POST",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            },
-        )
+        url = self._base + path
+        body = _clean(body)
+        use_msgpack = binary and self._msgpack_supported
+        if use_msgpack:
+            payload = msgpack.packb(body, use_bin_type=True)
+            headers = self._msgpack_headers
+        else:
+            payload = _json_dumps(body)
+            headers = self._headers
+        
+        cache_key = None
+        if cache and self.cache_size > 0 and path in _CACHEABLE_PATHS:
+            cache_key = hashlib.blake2b(path.encode("utf-8") + b"\0" + payload).digest()
+            with self._cache_lock:
+                if cache_key in self._cache:
+                    self._cache.move_to_end(cache_key)
+                    return copy.deepcopy(self._cache[cache_key])
+        
+        stream = path in _STREAMING_PATHS
+        idempotent = path in _CACHEABLE_PATHS
         
+        try:
+            result = self._send_payload(url, payload, headers, stream, idempotent)
+        except ValidationError as e:
+            # 415 Unsupported Media Type: the server has no msgpack variant
+            # of this endpoint. Use JSON from now on.
+            if not use_msgpack or e.status_code != 415:
+                raise
+            self._msgpack_supported = False
+            result = self._send_payload(url, _json_dumps(body), self._headers, stream, idempotent)
+        
+        result = _unwrap_response(result)
+        
+        if cache_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = copy.deepcopy(result)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        return result
+    
+    def _send_payload(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Dict[str, str],
+        stream: bool,
+        idempotent: bool,
+    ) -> Any:
+        """Send an encoded payload, gzip-compressing large bodies when the server allows it."""
+        if self._compress_requests and len(payload) > COMPRESS_MIN_BYTES:
+            try:
+                return self._send(
+                    url,
+                    gzip.compress(payload, compresslevel=4),
+                    {**headers, "Content-Encoding": "gzip"},
+                    stream,
+                    idempotent,
+                )
+            except ValidationError as e:
+                # 415 Unsupported Media Type. For msgpack bodies the server may
+                # be rejecting msgpack rather than gzip; let _http_post retry
+                # as JSON first. Only a rejected gzip JSON body proves the
+                # server does not accept compression: stop compressing and
+                # retry once plain.
+                if e.status_code != 415 or headers.get("Content-Type") != "application/json":
+                    raise
+                self._compress_requests = False
+        return self._send(url, payload, headers, stream, idempotent)
+    
+    def _send(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Dict[str, str],
+        stream: bool,
+        idempotent: bool,
+    ) -> Any:
+        """Send a POST over the best available transport and decode the response."""
+        if stream and self._http is not None and ijson is not None:
+            return self._send_streaming(url, payload, headers)
+        
+        if self._client is not None:
+            status, content_type, response_body = self._send_httpx(url, payload, headers)
+        elif self._http is not None:
+            status, content_type, response_body = self._send_pooled(url, payload, headers, idempotent)
+        else:
+            status, content_type, response_body = self._send_urllib(url, payload, headers)
+        
+        if status >= 300:
+            _raise_for_status(status, response_body)
+        
+        return _decode_response(content_type, response_body)
+    
+    def _send_pooled(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Dict[str, str],
+        idempotent: bool,
+    ) -> Tuple[int, Optional[str], bytes]:
+        """Send a POST over the pooled urllib3 connection manager."""
+        try:
+            resp = self._http.request(
+                "POST",
+                url,
+                body=payload,
+                headers=headers,
+                preload_content=True,
+                retries=self._idempotent_retries if idempotent else None,
+            )
+        except urllib3.exceptions.HTTPError as http_err:
+            raise NetworkError(f"Network error: {http_err}")
+        return resp.status, resp.headers.get("Content-Type"), resp.data
+    
+    def _send_httpx(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Dict[str, str],
+    ) -> Tuple[int, Optional[str], bytes]:
+        """Send a POST over the shared httpx (HTTP/2) client."""
+        try:
+            resp = self._client.post(url, content=payload, headers=headers)
+        except httpx.HTTPError as http_err:
+            raise NetworkError(f"Network error: {http_err}")
+        return resp.status_code, resp.headers.get("Content-Type"), resp.content
+    
+    def _send_streaming(self, url: str, payload: bytes, headers: Dict[str, str]) -> Any:
+        """
+        Send a POST and parse the JSON response incrementally with ijson.
+        
+        The result is built from parse events as bytes arrive, so the raw body
+        is never held in memory alongside the decoded result. Any top-level
+        JSON value is returned; empty or truncated bodies raise, as on the
+        buffered path.
+        """
+        try:
+            resp = self._http.request(
+                "POST",
+                url,
+                body=payload,
+                headers=headers,
+                preload_content=False,
+            )
+        except urllib3.exceptions.HTTPError as http_err:
+            raise NetworkError(f"Network error: {http_err}")
+        
+        try:
+            if resp.status >= 300:
+                _raise_for_status(resp.status, resp.read())
+            # items() raises IncompleteJSONError on an empty body, so a value
+            # is always produced here.
+            return next(ijson.items(resp, "", use_float=True))
+        except urllib3.exceptions.HTTPError as http_err:
+            raise NetworkError(f"Network error: {http_err}")
+        finally:
+            resp.drain_conn()
+            resp.release_conn()
+    
+    def _send_urllib(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Dict[str, str],
+    ) -> Tuple[int, Optional[str], bytes]:
+        """Send a POST with the standard library (no connection reuse)."""
+        req = request.Request(url, data=payload, method="POST", headers=headers)
         try:
             with request.urlopen(req) as resp:
-                response_body = resp.read().decode("utf-8")
-                result = json.loads(response_body)
-                
-                if isinstance(result, dict) and result.get("success") is True and "data" in result:
-                    return result["data"]
-                
-                if isinstance(result, dict) and result.get("success") is False:
-                    error_msg = result.get("error", "Unknown error")
-                    status = result.get("status", 500)
-                    raise EngineFailureError(error_msg, status)
-                
-                return result
+                return resp.status, resp.headers.get("Content-Type"), self._decode_body(resp.read(), resp.headers)
         except error.HTTPError as http_err:
-            error_body = http_err.read().decode("utf-8", errors="ignore")
-            try:
-                error_data = json.loads(error_body)
-                error_msg = error_data.get("error") or error_data.get("message") or error_body
-            except (json.JSONDecodeError, AttributeError):
-                error_msg = error_body or f"HTTP {http_err.code}"
-            
-            if 400 <= http_err.code < 500:
-                raise ValidationError(f"Request failed ({http_err.code}): {error_msg}")
-            elif http_err.code >= 500:
-                raise EngineFailureError(f"Server error ({http_err.code}): {error_msg}", http_err.code)
-            else:
-                raise NetworkError(f"Request failed ({http_err.code}): {error_msg}", http_err.code)
+            return (
+                http_err.code,
+                (http_err.headers or {}).get("Content-Type"),
+                self._decode_body(http_err.read(), http_err.headers),
+            )
         except error.URLError as url_err:
             raise NetworkError(f"Network error: {url_err.reason}")
     
+    @staticmethod
+    def _decode_body(data: bytes, headers: Any) -> bytes:
+        """Undo gzip content-encoding on a urllib response body."""
+        if headers is not None and headers.get("Content-Encoding", "").lower() == "gzip":
+            return gzip.decompress(data)
+        return data
+    
     def optimize(
         self,
         input_text: str,
@@ -152,6 +561,7 @@ class YAVIQClient:
         format: str = "auto",
         model: Optional[str] = None,
         debug: bool = False,
+        cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Optimize text input to reduce token count while preserving semantic meaning.
@@ -167,6 +577,7 @@ class YAVIQClient:
             format: Input format hint ("auto", "text", "json", "yaml", "csv")
             model: Target LLM model identifier (optional)
             debug: Enable debug mode for additional diagnostics
+            cache: Reuse a cached response for identical requests
         
         Returns:
             Dictionary with optimized text, tokensSaved, compression, etc.
@@ -178,6 +589,7 @@ class YAVIQClient:
         """
         if not input_text or not isinstance(input_text, str):
             raise ValidationError("Input is required and must be a string")
+        _check_input_size(len(input_text), self.max_input_bytes)
         
         mode = self._normalize_mode(mode)
         
@@ -186,10 +598,14 @@ class YAVIQClient:
             "format": format,
             "mode": mode,
             "model": model,
-        })
+        }, cache=cache)
         
         if self.send_telemetry:
-            print(f"[Telemetry] optimize: tokensSaved={result.get('tokensSaved', 0)}, compression={result.get('compression', 0)}%")
+            logger.info(
+                "[Telemetry] optimize: tokensSaved=%s, compression=%s%%",
+                result.get("tokensSaved", 0),
+                result.get("compression", 0),
+            )
         
         return result
     
@@ -234,6 +650,14 @@ class YAVIQClient:
         if not input_text or not isinstance(input_text, str):
             raise ValidationError("Input is required and must be a string")
         
+        size = len(input_text)
+        if history:
+            size += sum(
+                len(m["content"]) for m in history
+                if isinstance(m, dict) and isinstance(m.get("content"), str)
+            )
+        _check_input_size(size, self.max_input_bytes)
+        
         mode = self._normalize_mode(mode)
         
         result = self._http_post("/v1/optimize-run", {
@@ -251,7 +675,11 @@ class YAVIQClient:
         
         if self.send_telemetry:
             metrics = result.get("metrics", {})
-            print(f"[Telemetry] optimize_and_run: tokensUsed={metrics.get('total_tokens_used', 0)}, savings={metrics.get('final_total_savings_percent', '0%')}")
+            logger.info(
+                "[Telemetry] optimize_and_run: tokensUsed=%s, savings=%s",
+                metrics.get("total_tokens_used", 0),
+                metrics.get("final_total_savings_percent", "0%"),
+            )
         
         return result
     
@@ -260,6 +688,7 @@ class YAVIQClient:
         input_text: str,
         mode: str = "medium",
         format: str = "auto",
+        fast: bool = False,
     ) -> Dict[str, Any]:
         """
         Estimate potential token savings without performing full optimization.
@@ -267,13 +696,17 @@ class YAVIQClient:
         Performs a lightweight optimization pass to calculate expected savings.
         Useful for cost estimation and budgeting decisions.
         
-        Note: This method performs optimization internally for accuracy. For
-        heuristic-only estimation, use count_tokens().
+        Note: By default this method performs optimization internally for
+        accuracy. With fast=True it asks the /v1/estimate endpoint for the
+        expected compression ratio only and derives token counts with the
+        count_tokens() heuristic, skipping the optimization pass. Servers
+        without that endpoint fall back to the full optimization.
         
         Args:
             input_text: Text content to analyze
             mode: Compression mode to use
             format: Input format hint
+            fast: Use the ratio-only estimate endpoint instead of a full optimization
         
         Returns:
             Dictionary with original_tokens, optimized_tokens, estimated_savings,
@@ -285,11 +718,33 @@ class YAVIQClient:
         """
         if not input_text or not isinstance(input_text, str):
             raise ValidationError("Input is required and must be a string")
+        _check_input_size(len(input_text), self.max_input_bytes)
         
-        optimized = self.optimize(input_text, mode=mode, format=format)
+        estimate = None
+        if fast and self._estimate_supported:
+            try:
+                estimate = self._http_post("/v1/estimate", {
+                    "input": input_text,
+                    "format": format,
+                    "mode": self._normalize_mode(mode),
+                }, cache=True)
+            except ValidationError as e:
+                # Servers without the estimate endpoint: remember and use the
+                # full optimization path below.
+                if e.status_code not in (404, 405):
+                    raise
+                self._estimate_supported = False
         
-        original_tokens = optimized.get("originalTokens") or self.count_tokens(input_text)
-        optimized_tokens = optimized.get("optimizedTokens") or self.count_tokens(optimized.get("optimized", ""))
+        if estimate is not None:
+            original_tokens = estimate.get("originalTokens") or self.count_tokens(input_text)
+            compression = estimate.get("compression", 0) or 0
+            optimized_tokens = int(round(original_tokens * (1 - compression / 100)))
+            optimized_tokens = min(max(optimized_tokens, 0), original_tokens)
+        else:
+            optimized = self.optimize(input_text, mode=mode, format=format)
+            
+            original_tokens = optimized.get("originalTokens") or self.count_tokens(input_text)
+            optimized_tokens = optimized.get("optimizedTokens") or self.count_tokens(optimized.get("optimized", ""))
         estimated_savings = original_tokens - optimized_tokens
         estimated_savings_percent = (estimated_savings / original_tokens * 100) if original_tokens > 0 else 0
         
@@ -300,7 +755,7 @@ class YAVIQClient:
             "estimated_savings_percent": round(estimated_savings_percent, 2),
         }
     
-    def to_toon(self, input_text: str, format: str = "auto") -> str:
+    def to_toon(self, input_text: str, format: str = "auto", cache: bool = True) -> str:
         """
         Convert structured data (JSON, YAML, CSV) to TOON format.
         
@@ -310,6 +765,7 @@ class YAVIQClient:
         Args:
             input_text: Structured data string (JSON, YAML, or CSV)
             format: Input format hint ("auto", "json", "yaml", "csv")
+            cache: Reuse a cached response for identical requests
         
         Returns:
             TOON-formatted string
@@ -321,12 +777,13 @@ class YAVIQClient:
         """
         if not input_text or not isinstance(input_text, str):
             raise ValidationError("Input is required and must be a string")
+        _check_input_size(len(input_text), self.max_input_bytes)
         
         try:
             result = self._http_post("/v1/convert-to-toon", {
                 "input": input_text,
                 "format": format,
-            })
+            }, cache=cache, binary=True)
             return result["toon"]
         except Exception as e:
             if isinstance(e, YAVIQError):
@@ -337,12 +794,13 @@ class YAVIQClient:
     def convert_to_compressed(self, input_text: str, format: str = "auto") -> str:
         return self.to_toon(input_text, format)
     
-    def from_toon(self, toon: str) -> Any:
+    def from_toon(self, toon: str, cache: bool = True) -> Any:
         """
         Convert TOON format back to native Python data structures.
         
         Args:
             toon: TOON-formatted string to parse
+            cache: Reuse a cached response for identical requests
         
         Returns:
             Parsed Python object (dict, list, or primitive types)
@@ -354,11 +812,12 @@ class YAVIQClient:
         """
         if not toon or not isinstance(toon, str):
             raise ValidationError("TOON input is required and must be a string")
+        _check_input_size(len(toon), self.max_input_bytes)
         
         try:
             result = self._http_post("/v1/convert-from-toon", {
                 "toon": toon,
-            })
+            }, cache=cache, binary=True)
             return result["json"]
         except Exception as e:
             if isinstance(e, YAVIQError):
@@ -389,12 +848,13 @@ class YAVIQClient:
         """
         if not input_text or not isinstance(input_text, str):
             raise ValidationError("Input is required and must be a string")
+        _check_input_size(len(input_text), self.max_input_bytes)
         
         try:
             result = self._http_post("/v1/convert-to-toon", {
                 "input": input_text,
                 "format": format or "auto",
-            })
+            }, cache=True, binary=True)
             return {
                 "toon": result["toon"],
                 "format": result["format"],
@@ -417,6 +877,10 @@ class YAVIQClient:
         Applies specialized compression for RAG contexts: chunk-level optimization,
         relevance-based selection, and semantic compression preserving retrieval signals.
         
+        Lists of documents are sent as an array to the batch endpoint so they
+        are never concatenated client-side; servers without batch support get
+        the documents joined by blank lines.
+        
         Args:
             docs: Single document string or list of document strings
             mode: Compression mode (defaults to "balanced")
@@ -430,7 +894,40 @@ class YAVIQClient:
             ValidationError: If documents are invalid
             EngineFailureError: If RAG optimization fails
         """
-        input_text = "\n\n".join(docs) if isinstance(docs, list) else docs
+        if isinstance(docs, list):
+            if not docs or not all(isinstance(doc, str) for doc in docs):
+                raise ValidationError("Documents are required and must be strings")
+            _check_input_size(sum(len(doc) for doc in docs), self.max_input_bytes)
+            
+            if self._batch_supported:
+                try:
+                    result = self._http_post("/v1/optimize-run-batch", {
+                        "userId": "sdk_user",
+                        "docs": docs,
+                        "mode": self._normalize_mode(mode),
+                        "use_rag": True,
+                        "rag_chunk_limit": rag_chunk_limit or 10,
+                        "debug": debug,
+                    })
+                except ValidationError as e:
+                    # Older servers without the batch endpoint: remember and
+                    # fall back to a single joined document below.
+                    if e.status_code not in (404, 405):
+                        raise
+                    self._batch_supported = False
+                else:
+                    if self.send_telemetry:
+                        metrics = result.get("metrics", {})
+                        logger.info(
+                            "[Telemetry] optimize_rag: tokensUsed=%s, savings=%s",
+                            metrics.get("total_tokens_used", 0),
+                            metrics.get("final_total_savings_percent", "0%"),
+                        )
+                    return result
+            
+            input_text = "\n\n".join(docs)
+        else:
+            input_text = docs
         
         if not input_text or not isinstance(input_text, str):
             raise ValidationError("Documents are required")
@@ -504,15 +1001,240 @@ class YAVIQClient:
     
     def _normalize_mode(self, mode: str) -> str:
         """Normalize compression mode aliases to backend format."""
-        mode_map = {
-            "low": "safe",
-            "safe": "safe",
-            "medium": "balanced",
-            "balanced": "balanced",
-            "high": "aggressive",
-            "aggressive": "aggressive",
+        return _MODE_MAP.get(mode, "balanced")
+
+
+class AsyncYAVIQClient:
+    """
+    Asyncio client for issuing many YAVIQ requests concurrently.
+    
+    All calls share one aiohttp session and its keep-alive connection pool;
+    in-flight requests are bounded by max_concurrency. Use as an async
+    context manager or call close() to release connections.
+    
+    Requires the optional aiohttp dependency.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_input_bytes: int = DEFAULT_MAX_INPUT_BYTES,
+    ):
+        """
+        Initialize async YAVIQ client.
+        
+        Args:
+            api_key: API key for authentication. If None, reads from YAVIQ_API_KEY env var.
+            endpoint: Base API endpoint URL. If None, reads from YAVIQ_ENDPOINT env var
+                     or defaults to DEFAULT_ENDPOINT.
+            max_concurrency: Maximum number of requests in flight (and pooled
+                            connections) at any time.
+            max_input_bytes: Largest input accepted before a request is sent, measured
+                            in characters. Use 0 to disable the check.
+        
+        Raises:
+            ValidationError: If API key is not provided.
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncYAVIQClient requires aiohttp. Install it with: pip install yaviq[async]")
+        
+        self.api_key = api_key or os.environ.get("YAVIQ_API_KEY", "")
+        self.endpoint = endpoint or os.environ.get("YAVIQ_ENDPOINT", DEFAULT_ENDPOINT)
+        self.max_concurrency = max_concurrency
+        self.max_input_bytes = max_input_bytes
+        self._batch_supported = True
+        
+        if not self.api_key:
+            raise ValidationError(
+                "API key is required. Set YAVIQ_API_KEY environment variable or pass api_key to constructor."
+            )
+        
+        self._auth_header = f"Bearer {self.api_key}"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": self._auth_header,
         }
-        return mode_map.get(mode, "balanced")
+        # Created on first use so they bind to the running event loop.
+        self._session: Any = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def endpoint(self) -> str:
+        """Base API endpoint URL. Reassigning it takes effect on the next request."""
+        return self._endpoint
+    
+    @endpoint.setter
+    def endpoint(self, value: str) -> None:
+        self._endpoint = value
+        self._base = value.rstrip("/")
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "AsyncYAVIQClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    def _get_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._headers)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+    
+    async def _http_post(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute HTTP POST request to the YAVIQ API over the shared session.
+        
+        Error mapping and response unwrapping match YAVIQClient._http_post().
+        
+        Raises:
+            ValidationError: For 4xx client errors
+            EngineFailureError: For 5xx server errors
+            NetworkError: For network-level failures
+        """
+        session = self._get_session()
+        url = self._base + path
+        payload = _json_dumps(_clean(body))
+        
+        async with self._semaphore:
+            try:
+                async with session.post(url, data=payload) as resp:
+                    status = resp.status
+                    response_body = await resp.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as net_err:
+                raise NetworkError(f"Network error: {net_err}")
+        
+        if status >= 300:
+            _raise_for_status(status, response_body)
+        
+        return _unwrap_response(_json_loads(response_body))
+    
+    async def optimize(
+        self,
+        input_text: str,
+        mode: str = "medium",
+        format: str = "auto",
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Optimize text input. Async counterpart of YAVIQClient.optimize().
+        
+        Raises:
+            ValidationError: If input is invalid
+            EngineFailureError: If optimization fails
+            NetworkError: If network request fails
+        """
+        if not input_text or not isinstance(input_text, str):
+            raise ValidationError("Input is required and must be a string")
+        _check_input_size(len(input_text), self.max_input_bytes)
+        
+        return await self._http_post("/v1/optimize", {
+            "input": input_text,
+            "format": format,
+            "mode": _MODE_MAP.get(mode, "balanced"),
+            "model": model,
+        })
+    
+    async def optimize_many(
+        self,
+        texts: List[str],
+        mode: str = "medium",
+        format: str = "auto",
+        model: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Optimize several inputs concurrently.
+        
+        Args:
+            texts: Text inputs to optimize
+            mode: Compression mode applied to every input
+            format: Input format hint applied to every input
+            model: Target LLM model identifier (optional)
+        
+        Returns:
+            One optimize() result per input, in input order
+        """
+        return list(await asyncio.gather(*(
+            self.optimize(text, mode=mode, format=format, model=model) for text in texts
+        )))
+    
+    async def optimize_rag_parallel(
+        self,
+        docs: List[str],
+        chunk_size: int = 4,
+        mode: str = "balanced",
+        rag_chunk_limit: Optional[int] = None,
+        debug: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Optimize RAG documents as several concurrent requests.
+        
+        Splits docs into groups of chunk_size documents and sends each group
+        as its own RAG request, instead of one large round-trip.
+        
+        Args:
+            docs: Document strings
+            chunk_size: Number of documents per request
+            mode: Compression mode (defaults to "balanced")
+            rag_chunk_limit: Maximum number of chunks per request (default: 10)
+            debug: Enable debug mode for chunk-level diagnostics
+        
+        Returns:
+            One optimize_rag()-style result per group, in document order
+        
+        Raises:
+            ValidationError: If documents or chunk_size are invalid
+        """
+        if not isinstance(docs, list) or not docs or not all(isinstance(doc, str) for doc in docs):
+            raise ValidationError("Documents are required and must be strings")
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be at least 1")
+        
+        groups = [docs[i:i + chunk_size] for i in range(0, len(docs), chunk_size)]
+        for group in groups:
+            _check_input_size(sum(len(doc) for doc in group), self.max_input_bytes)
+        return list(await asyncio.gather(*(
+            self._optimize_rag_group(group, mode, rag_chunk_limit or 10, debug) for group in groups
+        )))
+    
+    async def _optimize_rag_group(
+        self,
+        docs: List[str],
+        mode: str,
+        rag_chunk_limit: int,
+        debug: bool,
+    ) -> Dict[str, Any]:
+        body = {
+            "userId": "sdk_user",
+            "mode": _MODE_MAP.get(mode, "balanced"),
+            "use_rag": True,
+            "rag_chunk_limit": rag_chunk_limit,
+            "debug": debug,
+        }
+        if self._batch_supported:
+            try:
+                return await self._http_post("/v1/optimize-run-batch", {**body, "docs": docs})
+            except ValidationError as e:
+                # Same fallback as YAVIQClient.optimize_rag().
+                if e.status_code not in (404, 405):
+                    raise
+                self._batch_supported = False
+        
+        return await self._http_post("/v1/optimize-run", {
+            **body,
+            "input": "\n\n".join(docs),
+            "format": "auto",
+            "use_history": False,
+        })
 
 
 def optimize(